@@ -6,4 +6,4 @@ from vm import Vm
 def solution(vm: Vm):
     vm.run()
     output = vm.output()
-    return re.findall(r"\w{12}", output)[0]
+    return re.search(r"\w{12}", output)[0]
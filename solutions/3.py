@@ -9,4 +9,4 @@ def solution(vm: Vm):
     vm.input("\n".join(["take tablet", "use tablet"]) + "\n")
     vm.run()
     output = vm.output()
-    return re.findall(r"\w{12}", output)[0]
+    return re.search(r"\w{12}", output)[0]
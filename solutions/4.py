@@ -34,4 +34,4 @@ def solution(vm: Vm):
     vm.input(last_action + "\n")
     vm.run()
     output = vm.output()
-    return re.findall(r"\w{12}", output)[0]
+    return re.search(r"\w{12}", output)[0]
@@ -73,4 +73,4 @@ def solution(vm: Vm):
     vm.input("\n".join(last_actions) + "\n")
     vm.run()
     output = vm.output()
-    return re.findall(r"\w{12}", output)[0]
+    return re.search(r"\w{12}", output)[0]
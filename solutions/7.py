@@ -91,6 +91,8 @@ actions = [
     "use mirror",
 ]
 
+mirror = str.maketrans("pqdb", "qpbd")
+
 
 def solution(vm: Vm):
     *pre_actions, last_action = actions
@@ -101,7 +103,5 @@ def solution(vm: Vm):
     vm.input(last_action + "\n")
     vm.run()
     output = vm.output()
-    mirrored = re.findall(r"\w{12}", output)[0]
-    return "".join(
-        {"p": "q", "q": "p", "d": "b", "b": "d"}.get(c, c) for c in reversed(mirrored)
-    )
+    mirrored = re.search(r"\w{12}", output)[0]
+    return mirrored[::-1].translate(mirror)
@@ -0,0 +1,13 @@
+import pytest
+
+import vm
+
+
+@pytest.fixture(params=["python", "numba"])
+def interpreter(request, monkeypatch):
+    """Run a test once on the pure-Python handlers and once on the Numba loop."""
+    if request.param == "python":
+        monkeypatch.setattr(vm, "_run", None)
+    else:
+        pytest.importorskip("numba")
+    return request.param
@@ -15,7 +15,7 @@ hashes = [
 
 
 @pytest.mark.parametrize("solution_number, expected_hash", enumerate(hashes))
-def test_solutions(solution_number, expected_hash):
+def test_solutions(solution_number, expected_hash, interpreter):
     try:
         module = importlib.import_module(f"solutions.{solution_number}")
     except ModuleNotFoundError:
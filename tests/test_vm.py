@@ -0,0 +1,168 @@
+import array
+import ast
+
+import pytest
+
+from vm import State, Vm
+
+
+def load(*words: int) -> Vm:
+    memory = array.array("H", words)
+    memory.extend([0] * (2**15 + 8 - len(memory)))
+    return Vm(memory, [], 0)
+
+
+def test_invalid_opcode(interpreter):
+    vm = load(21, 22)
+    with pytest.raises(ValueError, match="Invalid opcode 22"):
+        vm.run()
+
+
+def test_from_file_odd_length(tmp_path):
+    path = tmp_path / "odd.bin"
+    path.write_bytes(bytes([21, 0, 19]))
+
+    vm = Vm.from_file(str(path))
+
+    assert vm.memory[:3].tolist() == [21, 19, 0]
+    assert len(vm.memory) == 2**15 + 8
+
+
+def test_from_file_longer_than_memory(tmp_path):
+    path = tmp_path / "long.bin"
+    path.write_bytes(bytes(2 * (2**15 + 10)))
+
+    vm = Vm.from_file(str(path))
+
+    assert len(vm.memory) == 2**15 + 10
+
+
+def test_from_file_invalid_number(tmp_path):
+    path = tmp_path / "invalid.bin"
+    path.write_bytes((21).to_bytes(2, "little") + (32776).to_bytes(2, "little"))
+
+    with pytest.raises(ValueError, match="Invalid number 32776"):
+        Vm.from_file(str(path))
+
+
+def test_halt(interpreter):
+    vm = load(21, 0)
+    vm.run()
+
+    assert vm.state == State.HALTED
+    assert vm.ip == 2
+
+
+def test_ret_on_empty_stack_halts(interpreter):
+    vm = load(21, 18)
+    vm.run()
+
+    assert vm.state == State.HALTED
+    assert vm.ip == 2
+
+
+def test_in_without_input_blocks_on_opcode(interpreter):
+    vm = load(21, 20, 32768, 0)
+    vm.run()
+
+    assert vm.state == State.INPUT_BLOCKED
+    assert vm.ip == 1
+
+    vm.input("A")
+    vm.run()
+
+    assert vm.state == State.HALTED
+    assert vm.memory[32768] == ord("A")
+
+
+def test_breakpoint_runs_custom_command(interpreter):
+    vm = load(21, 21, 19, 32768, 0)
+    vm.breakpoints.add(2)
+    vm.input("_set-register 0 66\n")
+    vm.run()
+
+    assert vm.state == State.HALTED
+    assert vm.output() == "B"
+
+
+def test_push_grows_stack(interpreter):
+    # push 1; add r0 r0 1; eq r1 r0 300; jf r1 0; halt
+    vm = load(2, 1, 9, 32768, 32768, 1, 4, 32769, 32768, 300, 8, 32769, 0, 0)
+    vm.run()
+
+    assert vm.state == State.HALTED
+    assert vm.sp == 300
+    assert len(vm.stack) > 300
+    assert vm.dump()[1] == (1,) * 300
+
+
+def test_dump_and_load(tmp_path, interpreter):
+    path = tmp_path / "state.txt"
+    vm = Vm.from_file("./challenge.bin")
+    vm.run()
+    vm.input(f"take tablet\n_dump {path}\n")
+    vm.run()
+
+    loaded = Vm.from_dump(ast.literal_eval(path.read_text()))
+    loaded.input("inv\n")
+    loaded.run()
+
+    assert loaded.state == State.INPUT_BLOCKED
+    assert "Your inventory:\n- tablet\n" in loaded.output()
+
+
+@pytest.mark.parametrize("text, echoed", [("é\n", "é\n"), ("€\n", "?\n")])
+def test_non_ascii_input(text, echoed, interpreter):
+    # in r0; out r0; in r0; out r0; halt
+    vm = load(20, 32768, 19, 32768, 20, 32768, 19, 32768, 0)
+    vm.input(text)
+    vm.run()
+
+    assert vm.state == State.HALTED
+    assert vm.output() == echoed
+
+
+def test_not_on_register_above_15_bits(interpreter):
+    # not r1 r0; halt
+    vm = load(14, 32769, 32768, 0)
+    vm.memory[32768] = 32775
+    vm.run()
+
+    assert vm.memory[32769] == 32760
+
+
+@pytest.mark.parametrize(
+    "words",
+    [
+        (16, 32769, 65, 0),  # wmem r1 65; halt
+        (15, 32768, 32769, 0),  # rmem r0 r1; halt
+        (6, 32769),  # jmp r1
+    ],
+)
+def test_address_outside_memory(words, interpreter):
+    vm = load(*words)
+    vm.memory[32769] = 40000
+
+    with pytest.raises(IndexError):
+        vm.run()
+
+
+def test_mod_by_zero_keeps_state(interpreter):
+    # push 7; mod r0 1 0
+    vm = load(2, 7, 11, 32768, 1, 0)
+
+    with pytest.raises(ZeroDivisionError):
+        vm.run()
+
+    assert vm.dump()[1] == (7,)
+    assert vm.ip == 2
+
+
+def test_pop_from_empty_stack_keeps_ip(interpreter):
+    # noop; pop r0
+    vm = load(21, 3, 32768)
+
+    with pytest.raises(IndexError):
+        vm.run()
+
+    assert vm.ip == 1
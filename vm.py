@@ -1,5 +1,15 @@
+import array
 import enum
-import io
+import sys
+from collections.abc import Iterable
+
+try:
+    import numba
+    import numpy as np
+except ImportError:  # The JIT-compiled interpreter loop is optional
+    numba = None
+
+OUT_BUF_SIZE = 2**16
 
 
 class State(enum.Enum):
@@ -9,70 +19,113 @@ class State(enum.Enum):
 
 
 class Vm:
-    def __init__(self, memory: list[int], stack: list[int], ip: int) -> None:
+    def __init__(self, memory: array.array, stack: Iterable[int], ip: int) -> None:
         self.memory = memory
-        self.stack = stack
+        self.stack = array.array("I", stack)
+        self.sp = len(self.stack)
+        self._grow_stack()
         self.ip = ip
         self.state = State.READY
-        self.reader = io.StringIO()
-        self.writer = io.StringIO()
+        self.reader = bytearray()
+        self._read_pos = 0
+        self.writer = bytearray()
         self.breakpoints = set()
 
     @classmethod
     def from_file(cls, file: str) -> "Vm":
-        instructions = []
         with open(file, "rb") as f:
-            while word := f.read(2):
-                num = int.from_bytes(word, byteorder="little", signed=False)
-                instructions.append(num)
-        memory = instructions + [0] * (2**15 - len(instructions) + 8)
+            data = f.read()
+        if len(data) % 2:  # A trailing odd byte is a word with a zero high byte
+            data += b"\0"
+        memory = array.array("H")
+        memory.frombytes(data)
+        if sys.byteorder == "big":
+            memory.byteswap()
+        if memory and (largest := max(memory)) > 32775:
+            raise ValueError(f"Invalid number {largest}")
+        memory.frombytes(bytes(2 * max(2**15 - len(memory) + 8, 0)))
         return cls(memory, [], 0)
 
     @classmethod
-    def from_dump(cls, dump: tuple[tuple[int, ...], tuple[int, ...], int]) -> "Vm":
-        memory, stack, ip = dump
-        return cls(list(memory), list(stack), ip)
+    def from_dump(cls, dump: tuple[bytes, tuple[int, ...], int]) -> "Vm":
+        memory_bytes, stack, ip = dump
+        memory = array.array("H")
+        memory.frombytes(memory_bytes)
+        return cls(memory, stack, ip)
 
-    def dump(self) -> tuple[tuple[int, ...], tuple[int, ...], int]:
-        return (tuple(self.memory), tuple(self.stack), self.ip)
+    def dump(self) -> tuple[bytes, tuple[int, ...], int]:
+        return (self.memory.tobytes(), tuple(self.stack[: self.sp]), self.ip)
 
     def input(self, s: str) -> None:
-        pos = self.reader.tell()
-        self.reader.write(s)
-        self.reader.seek(pos)
+        del self.reader[: self._read_pos]
+        self._read_pos = 0
+        # One byte per character; characters above U+00FF are read as "?"
+        self.reader.extend(s.encode("latin-1", errors="replace"))
         self.state = State.READY
 
     def output(self) -> str:
-        s = self.writer.getvalue()
-        self.writer.truncate(0)
-        self.writer.seek(0)
+        s = self.writer.decode("latin-1")
+        self.writer.clear()
         return s
 
-    def grab(self) -> int:
-        result = self.memory[self.ip]
-        self.ip += 1
-        if result <= 32775:
-            return result
-        raise ValueError(f"Invalid number {result}")
-
-    def val(self, i: int) -> int:
-        if i <= 32767:
-            return i
-        if i <= 32775:
-            return self.memory[i]
-        raise ValueError(f"Invalid number {i}")
+    def _grow_stack(self) -> None:
+        self.stack.frombytes(bytes(self.stack.itemsize * max(len(self.stack), 256)))
 
     def run(self) -> None:
+        run_until_step = self._run_python if _run is None else self._run_native
         while True:
-            self.step()
+            run_until_step()
+            if self.state == State.READY:
+                self.step()
             if self.state != State.READY:
                 break
 
+    def _run_python(self) -> None:
+        """Execute instructions until one needs Vm.step, like _run.
+
+        Handlers get the memory, the address of their first operand and the address
+        of the next instruction, and return the new ip. Handlers that stop the VM
+        store ip themselves and return None.
+        """
+        m = self.memory
+        breakpoints = self.breakpoints
+        handlers = HANDLERS
+        arity = ARITY
+        ip = self.ip
+        try:
+            while ip not in breakpoints and (op := m[ip]) != 20:
+                ip = handlers[op](self, m, ip + 1, ip + 1 + arity[op])
+                if ip is None:
+                    return
+        finally:
+            # On a fault ip is still the address of the faulting instruction
+            if ip is not None:
+                self.ip = ip
+
+    def _run_native(self) -> None:
+        memory = np.frombuffer(self.memory, dtype=np.uint16)
+        stack = np.frombuffer(self.stack, dtype=np.uint32)
+        breakpoints = np.zeros(len(memory), dtype=np.bool_)
+        breakpoints[[b for b in self.breakpoints if 0 <= b < len(memory)]] = True
+        in_buf = np.frombuffer(self.reader, dtype=np.uint8, offset=self._read_pos)
+        out_buf = np.empty(OUT_BUF_SIZE, dtype=np.uint8)
+
+        ip, sp, in_pos, out_pos = _run(
+            memory, stack, self.sp, self.ip, breakpoints, in_buf, out_buf
+        )
+
+        self.sp = sp
+        self.ip = ip
+        self._read_pos += in_pos
+        self.writer += out_buf.data[:out_pos]
+
     def step(self) -> None:
         # Custom commands
         if self.ip in self.breakpoints or self.memory[self.ip] == 20:
-            pos = self.reader.tell()
-            line = self.reader.readline().strip()
+            pos = self._read_pos
+            end = self.reader.find(b"\n", pos) + 1 or len(self.reader)
+            line = self.reader[pos:end].decode("latin-1").strip()
+            self._read_pos = end
             command, *args = line.split(" ")
             # print(f"{command=} {args=}")
             match command:
@@ -91,96 +144,152 @@ class Vm:
                 case "_set-ip":
                     self.ip = int(args[0])
                 case _:
-                    self.reader.seek(pos)
-            if self.reader.tell() != pos:
+                    self._read_pos = pos
+            if self._read_pos != pos:
                 return
 
-        g = self.grab
-        v = self.val
-        op = g()
-        match op:
-            case 0:  # halt: 0; stop execution and terminate the program
-                self.state = State.HALTED
-            case 1:  # set: 1 a b; set register <a> to the self.value of <b>
-                a, b = g(), g()
-                self.memory[a] = v(b)
-            case 2:  # push: 2 a; push <a> onto the self.stack
-                a = g()
-                self.stack.append(v(a))
-            case 3:  # pop: 3 a; remove the top element from the self.stack and write it into <a>; empty self.stack = error
-                a = g()
-                self.memory[a] = self.stack.pop()
-            case 4:  # eq: 4 a b c; set <a> to 1 if <b> is equal to <c>; set it to 0 otherwise
-                a, b, c = g(), g(), g()
-                self.memory[a] = int(v(b) == v(c))
-            case 5:  # gt: 5 a b c; set <a> to 1 if <b> is greater than <c>; set it to 0 otherwise
-                a, b, c = g(), g(), g()
-                self.memory[a] = int(v(b) > v(c))
-            case 6:  # jmp: 6 a; jump to <a>
-                a = g()
-                self.ip = v(a)
-            case 7:  # jt: 7 a b; if <a> is nonzero, jump to <b>
-                a, b = g(), g()
-                if v(a):
-                    self.ip = v(b)
-            case 8:  # jf: 8 a b; if <a> is zero, jump to <b>
-                a, b = g(), g()
-                if not v(a):
-                    self.ip = v(b)
-            case 9:  # add: 9 a b c; assign into <a> the sum of <b> and <c> (modulo 32768)
-                a, b, c = g(), g(), g()
-                self.memory[a] = (v(b) + v(c)) % 32768
-            case 10:  # mult: 10 a b c; store into <a> the product of <b> and <c> (modulo 32768)
-                a, b, c = g(), g(), g()
-                self.memory[a] = (v(b) * v(c)) % 32768
-            case 11:  # mod: 11 a b c; store into <a> the remainder of <b> divided by <c>
-                a, b, c = g(), g(), g()
-                self.memory[a] = v(b) % v(c)
-            case 12:  # and: 12 a b c; stores into <a> the bitwise and of <b> and <c>
-                a, b, c = g(), g(), g()
-                self.memory[a] = v(b) & v(c)
-            case 13:  # or: 13 a b c; stores into <a> the bitwise or of <b> and <c>
-                a, b, c = g(), g(), g()
-                self.memory[a] = v(b) | v(c)
-            case 14:  # not: 14 a b; stores 15-bit bitwise inverse of <b> in <a>
-                a, b = g(), g()
-                self.memory[a] = ((1 << 15) - 1) & ~v(b)
-            case 15:  # rmem: 15 a b; read memory at address <b> and write it to <a>
-                a, b = g(), g()
-                # memory[a] = get(b)
-                self.memory[a] = self.memory[v(b)]
-                # memory[a] = memory[b]
-            case 16:  # wmem: 16 a b; write the value from <b> into memory at address <a>
-                a, b = g(), g()
-                self.memory[v(a)] = v(b)
-            case 17:  # call: 17 a; write the address of the next instruction to the self.stack and jump to <a>
-                a = g()
-                self.stack.append(self.ip)
-                self.ip = v(a)
-            case 18:  # ret: 18; remove the top element from the self.stack and jump to it; empty self.stack = halt
-                if not self.stack:
-                    self.state = State.HALTED
-                else:
-                    self.ip = self.stack.pop()
-            case 19:  # out: 19 a; write the character represented by ascii code <a> to the terminal
-                a = g()
-                self.writer.write(chr(v(a)))
-            case 20:  # in: 20 a; read a character from the terminal and write its ascii code to <a>; it can be assumed that once input starts, it will continue until a newline is encountered; this means that you can safely read whole lines from the keyboard instead of having to figure out how to read individual characters
-                a = g()
-                ch = self.reader.read(1)
-                if not ch:
-                    self.state = State.INPUT_BLOCKED
-                    self.ip -= 2
-                else:
-                    self.memory[a] = ord(ch)
-            case 21:  # noop: 21; no operation
-                pass
+        m = self.memory
+        ip = self.ip
+        op = m[ip]
+        ip = HANDLERS[op](self, m, ip + 1, ip + 1 + ARITY[op])
+        if ip is not None:
+            self.ip = ip
+
+    def _op_halt(self, m: array.array, p: int, ip: int) -> int | None:  # halt: 0; stop execution and terminate the program
+        self.state = State.HALTED
+        self.ip = ip
+        return None
+
+    def _op_set(self, m: array.array, p: int, ip: int) -> int | None:  # set: 1 a b; set register <a> to the value of <b>
+        a, b = m[p], m[p + 1]
+        m[a] = b if b < 32768 else m[b]
+        return ip
+
+    def _op_push(self, m: array.array, p: int, ip: int) -> int | None:  # push: 2 a; push <a> onto the stack
+        a = m[p]
+        sp = self.sp
+        if sp == len(self.stack):
+            self._grow_stack()
+        self.stack[sp] = a if a < 32768 else m[a]
+        self.sp = sp + 1
+        return ip
+
+    def _op_pop(self, m: array.array, p: int, ip: int) -> int | None:  # pop: 3 a; remove the top element from the stack and write it into <a>; empty stack = error
+        if not self.sp:
+            raise IndexError("pop from empty stack")
+        self.sp -= 1
+        m[m[p]] = self.stack[self.sp]
+        return ip
+
+    def _op_eq(self, m: array.array, p: int, ip: int) -> int | None:  # eq: 4 a b c; set <a> to 1 if <b> is equal to <c>; set it to 0 otherwise
+        a, b, c = m[p], m[p + 1], m[p + 2]
+        m[a] = int((b if b < 32768 else m[b]) == (c if c < 32768 else m[c]))
+        return ip
+
+    def _op_gt(self, m: array.array, p: int, ip: int) -> int | None:  # gt: 5 a b c; set <a> to 1 if <b> is greater than <c>; set it to 0 otherwise
+        a, b, c = m[p], m[p + 1], m[p + 2]
+        m[a] = int((b if b < 32768 else m[b]) > (c if c < 32768 else m[c]))
+        return ip
+
+    def _op_jmp(self, m: array.array, p: int, ip: int) -> int | None:  # jmp: 6 a; jump to <a>
+        a = m[p]
+        return a if a < 32768 else m[a]
+
+    def _op_jt(self, m: array.array, p: int, ip: int) -> int | None:  # jt: 7 a b; if <a> is nonzero, jump to <b>
+        a, b = m[p], m[p + 1]
+        if a if a < 32768 else m[a]:
+            return b if b < 32768 else m[b]
+        return ip
+
+    def _op_jf(self, m: array.array, p: int, ip: int) -> int | None:  # jf: 8 a b; if <a> is zero, jump to <b>
+        a, b = m[p], m[p + 1]
+        if not (a if a < 32768 else m[a]):
+            return b if b < 32768 else m[b]
+        return ip
+
+    def _op_add(self, m: array.array, p: int, ip: int) -> int | None:  # add: 9 a b c; assign into <a> the sum of <b> and <c> (modulo 32768)
+        a, b, c = m[p], m[p + 1], m[p + 2]
+        m[a] = ((b if b < 32768 else m[b]) + (c if c < 32768 else m[c])) & 0x7FFF
+        return ip
+
+    def _op_mult(self, m: array.array, p: int, ip: int) -> int | None:  # mult: 10 a b c; store into <a> the product of <b> and <c> (modulo 32768)
+        a, b, c = m[p], m[p + 1], m[p + 2]
+        m[a] = ((b if b < 32768 else m[b]) * (c if c < 32768 else m[c])) & 0x7FFF
+        return ip
+
+    def _op_mod(self, m: array.array, p: int, ip: int) -> int | None:  # mod: 11 a b c; store into <a> the remainder of <b> divided by <c>
+        a, b, c = m[p], m[p + 1], m[p + 2]
+        m[a] = (b if b < 32768 else m[b]) % (c if c < 32768 else m[c])
+        return ip
+
+    def _op_and(self, m: array.array, p: int, ip: int) -> int | None:  # and: 12 a b c; stores into <a> the bitwise and of <b> and <c>
+        a, b, c = m[p], m[p + 1], m[p + 2]
+        m[a] = (b if b < 32768 else m[b]) & (c if c < 32768 else m[c])
+        return ip
+
+    def _op_or(self, m: array.array, p: int, ip: int) -> int | None:  # or: 13 a b c; stores into <a> the bitwise or of <b> and <c>
+        a, b, c = m[p], m[p + 1], m[p + 2]
+        m[a] = (b if b < 32768 else m[b]) | (c if c < 32768 else m[c])
+        return ip
+
+    def _op_not(self, m: array.array, p: int, ip: int) -> int | None:  # not: 14 a b; stores 15-bit bitwise inverse of <b> in <a>
+        a, b = m[p], m[p + 1]
+        m[a] = ~(b if b < 32768 else m[b]) & 0x7FFF
+        return ip
+
+    def _op_rmem(self, m: array.array, p: int, ip: int) -> int | None:  # rmem: 15 a b; read memory at address <b> and write it to <a>
+        a, b = m[p], m[p + 1]
+        m[a] = m[b if b < 32768 else m[b]]
+        return ip
+
+    def _op_wmem(self, m: array.array, p: int, ip: int) -> int | None:  # wmem: 16 a b; write the value from <b> into memory at address <a>
+        a, b = m[p], m[p + 1]
+        m[a if a < 32768 else m[a]] = b if b < 32768 else m[b]
+        return ip
+
+    def _op_call(self, m: array.array, p: int, ip: int) -> int | None:  # call: 17 a; write the address of the next instruction to the stack and jump to <a>
+        a = m[p]
+        sp = self.sp
+        if sp == len(self.stack):
+            self._grow_stack()
+        self.stack[sp] = ip
+        self.sp = sp + 1
+        return a if a < 32768 else m[a]
+
+    def _op_ret(self, m: array.array, p: int, ip: int) -> int | None:  # ret: 18; remove the top element from the stack and jump to it; empty stack = halt
+        if not self.sp:
+            self.state = State.HALTED
+            self.ip = ip
+            return None
+        self.sp -= 1
+        return self.stack[self.sp]
+
+    def _op_out(self, m: array.array, p: int, ip: int) -> int | None:  # out: 19 a; write the character represented by ascii code <a> to the terminal
+        a = m[p]
+        self.writer.append((a if a < 32768 else m[a]) & 0xFF)
+        return ip
+
+    def _op_in(self, m: array.array, p: int, ip: int) -> int | None:  # in: 20 a; read a character from the terminal and write its ascii code to <a>; it can be assumed that once input starts, it will continue until a newline is encountered; this means that you can safely read whole lines from the keyboard instead of having to figure out how to read individual characters
+        pos = self._read_pos
+        if pos >= len(self.reader):
+            self.state = State.INPUT_BLOCKED
+            self.ip = p - 1
+            return None
+        m[m[p]] = self.reader[pos]
+        self._read_pos = pos + 1
+        return ip
+
+    def _op_noop(self, m: array.array, p: int, ip: int) -> int | None:  # noop: 21; no operation
+        return ip
+
+    def _op_invalid(self, m: array.array, p: int, ip: int) -> int | None:
+        raise ValueError(f"Invalid opcode {m[p - 1]}")
 
     def resume(self) -> None:
         print("--- Resuming VM ---")
 
         while True:
-            self.step()
+            self.run()
             print(self.output(), end="")
 
             if self.state == State.INPUT_BLOCKED:
@@ -191,15 +300,201 @@ class Vm:
         print("--- VM Exited ---")
 
 
+_run = None
+
+if numba is not None:
+
+    @numba.njit(cache=True, nogil=True)
+    def _run(mem, stack, sp, ip, breakpoints, in_buf, out_buf):
+        """Execute instructions until one needs Vm.step.
+
+        That is a breakpoint, a halt, a custom command, an empty stack or input
+        buffer, a full stack or output buffer, or anything that makes the Python
+        handler raise: ip or an rmem/wmem address outside memory, or mod by zero.
+        Returns (ip, sp, in_pos, out_pos).
+        """
+        n = len(mem)
+        in_pos = 0
+        out_pos = 0
+        while True:
+            # Leave room for the longest instruction's operands
+            if ip + 4 > n or breakpoints[ip]:
+                break
+            op = mem[ip]
+            if op == 1:  # set
+                a, b = mem[ip + 1], mem[ip + 2]
+                mem[a] = b if b < 32768 else mem[b]
+                ip += 3
+            elif op == 2:  # push
+                if sp == len(stack):
+                    break
+                a = mem[ip + 1]
+                stack[sp] = a if a < 32768 else mem[a]
+                sp += 1
+                ip += 2
+            elif op == 3:  # pop
+                if sp == 0:
+                    break
+                sp -= 1
+                mem[mem[ip + 1]] = stack[sp]
+                ip += 2
+            elif op == 4:  # eq
+                a, b, c = mem[ip + 1], mem[ip + 2], mem[ip + 3]
+                mem[a] = (b if b < 32768 else mem[b]) == (c if c < 32768 else mem[c])
+                ip += 4
+            elif op == 5:  # gt
+                a, b, c = mem[ip + 1], mem[ip + 2], mem[ip + 3]
+                mem[a] = (b if b < 32768 else mem[b]) > (c if c < 32768 else mem[c])
+                ip += 4
+            elif op == 6:  # jmp
+                a = mem[ip + 1]
+                ip = a if a < 32768 else mem[a]
+            elif op == 7:  # jt
+                a, b = mem[ip + 1], mem[ip + 2]
+                if (a if a < 32768 else mem[a]) != 0:
+                    ip = b if b < 32768 else mem[b]
+                else:
+                    ip += 3
+            elif op == 8:  # jf
+                a, b = mem[ip + 1], mem[ip + 2]
+                if (a if a < 32768 else mem[a]) == 0:
+                    ip = b if b < 32768 else mem[b]
+                else:
+                    ip += 3
+            elif op == 9:  # add
+                a, b, c = mem[ip + 1], mem[ip + 2], mem[ip + 3]
+                mem[a] = (
+                    (b if b < 32768 else mem[b]) + (c if c < 32768 else mem[c])
+                ) & 0x7FFF
+                ip += 4
+            elif op == 10:  # mult
+                a, b, c = mem[ip + 1], mem[ip + 2], mem[ip + 3]
+                mem[a] = (
+                    (b if b < 32768 else mem[b]) * (c if c < 32768 else mem[c])
+                ) & 0x7FFF
+                ip += 4
+            elif op == 11:  # mod
+                a, b, c = mem[ip + 1], mem[ip + 2], mem[ip + 3]
+                c = c if c < 32768 else mem[c]
+                if c == 0:
+                    break
+                mem[a] = (b if b < 32768 else mem[b]) % c
+                ip += 4
+            elif op == 12:  # and
+                a, b, c = mem[ip + 1], mem[ip + 2], mem[ip + 3]
+                mem[a] = (b if b < 32768 else mem[b]) & (c if c < 32768 else mem[c])
+                ip += 4
+            elif op == 13:  # or
+                a, b, c = mem[ip + 1], mem[ip + 2], mem[ip + 3]
+                mem[a] = (b if b < 32768 else mem[b]) | (c if c < 32768 else mem[c])
+                ip += 4
+            elif op == 14:  # not
+                a, b = mem[ip + 1], mem[ip + 2]
+                mem[a] = ~(b if b < 32768 else mem[b]) & 0x7FFF
+                ip += 3
+            elif op == 15:  # rmem
+                a, b = mem[ip + 1], mem[ip + 2]
+                b = b if b < 32768 else mem[b]
+                if b >= n:
+                    break
+                mem[a] = mem[b]
+                ip += 3
+            elif op == 16:  # wmem
+                a, b = mem[ip + 1], mem[ip + 2]
+                a = a if a < 32768 else mem[a]
+                if a >= n:
+                    break
+                mem[a] = b if b < 32768 else mem[b]
+                ip += 3
+            elif op == 17:  # call
+                if sp == len(stack):
+                    break
+                a = mem[ip + 1]
+                stack[sp] = ip + 2
+                sp += 1
+                ip = a if a < 32768 else mem[a]
+            elif op == 18:  # ret
+                if sp == 0:
+                    break
+                sp -= 1
+                ip = stack[sp]
+            elif op == 19:  # out
+                a = mem[ip + 1]
+                ch = a if a < 32768 else mem[a]
+                if out_pos == len(out_buf):
+                    break
+                out_buf[out_pos] = ch & 0xFF
+                out_pos += 1
+                ip += 2
+            elif op == 20:  # in
+                # Custom commands all start with "_" and are handled by Vm.step
+                if in_pos == len(in_buf) or in_buf[in_pos] == ord("_"):
+                    break
+                mem[mem[ip + 1]] = in_buf[in_pos]
+                in_pos += 1
+                ip += 2
+            elif op == 21:  # noop
+                ip += 1
+            else:  # halt and invalid opcodes
+                break
+        return ip, sp, in_pos, out_pos
+
+
+# Operand count of each opcode, indexed by opcode
+ARITY = bytes([0, 2, 1, 1, 3, 3, 1, 2, 2, 3, 3, 3, 3, 3, 2, 2, 2, 1, 0, 1, 1, 0])
+
+# Opcode dispatch table, indexed by opcode
+HANDLERS = (
+    Vm._op_halt,
+    Vm._op_set,
+    Vm._op_push,
+    Vm._op_pop,
+    Vm._op_eq,
+    Vm._op_gt,
+    Vm._op_jmp,
+    Vm._op_jt,
+    Vm._op_jf,
+    Vm._op_add,
+    Vm._op_mult,
+    Vm._op_mod,
+    Vm._op_and,
+    Vm._op_or,
+    Vm._op_not,
+    Vm._op_rmem,
+    Vm._op_wmem,
+    Vm._op_call,
+    Vm._op_ret,
+    Vm._op_out,
+    Vm._op_in,
+    Vm._op_noop,
+)
+
+# Pad both tables to every 16-bit word so that unknown opcodes reach _op_invalid
+ARITY = ARITY.ljust(2**16, b"\0")
+HANDLERS += (Vm._op_invalid,) * (2**16 - len(HANDLERS))
+
+
 if __name__ == "__main__":
     import argparse
+    import ast
 
     parser = argparse.ArgumentParser("vm")
     parser.add_argument(
-        "file", help="Path of bin file.", default="./challenge.bin", type=str, nargs="?"
+        "file", help="Path of bin file. (default: ./challenge.bin)", type=str, nargs="?"
+    )
+    parser.add_argument(
+        "--load",
+        help="Path of a state file written by _dump, instead of file.",
+        type=str,
     )
     args = parser.parse_args()
 
-    vm = Vm.from_file(args.file)
+    if args.load:
+        if args.file:
+            parser.error("file cannot be combined with --load")
+        with open(args.load) as f:
+            vm = Vm.from_dump(ast.literal_eval(f.read()))
+    else:
+        vm = Vm.from_file(args.file or "./challenge.bin")
 
     vm.resume()